@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import asyncio
+from collections import deque
 from datetime import timedelta
 from http import HTTPStatus
 from json.decoder import JSONDecodeError
@@ -159,7 +160,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         raise ConfigEntryNotReady from ex
 
     hass.data[DOMAIN][entry.entry_id] = {}
-    hass.data[DOMAIN]["id_log"] = []
+    hass.data[DOMAIN]["id_log"] = deque(maxlen=500)
     hass.data[DOMAIN][entry.entry_id]["retries_401"] = 0
     hass.data[DOMAIN][entry.entry_id]["listener"] = None
     hass.data[DOMAIN][entry.entry_id][API] = AsyncConfigEntryAuth(
@@ -216,11 +217,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         # data["122B027"] = TEST_DATA_27_OFF
         # data["1223073"] = TEST_DATA_73
         # data["1223074"] = TEST_DATA_74
-        flat_result: dict = {}
         try:
-            for ent in data:
-                flat_result[ent] = dict(flatdict.FlatterDict(data[ent], delimiter="|"))
-            coordinator.async_set_updated_data(flat_result)
+            coordinator.async_set_updated_data(_flatten_data(data))
         except Exception:  # pylint: disable=broad-except  # noqa: E722
             _LOGGER.warning("Failed to process pushed data from API")
 
@@ -286,7 +284,6 @@ async def get_coordinator(
             raise UpdateFailed(error) from error
 
         hass.data[DOMAIN][entry.entry_id]["retries_401"] = 0
-        flat_result: dict = {}
         # result["1223001"] = TEST_DATA_1
         # result["1223004"] = TEST_DATA_4
         # result["1223007"] = TEST_DATA_7
@@ -304,10 +301,7 @@ async def get_coordinator(
         # result["1223074"] = TEST_DATA_74
 
         try:
-            for ent in result:
-                flat_result[ent] = dict(
-                    flatdict.FlatterDict(result[ent], delimiter="|")
-                )
+            flat_result = _flatten_data(result)
         except TypeError as ex:
             _LOGGER.error("Error flattening data")
             raise UpdateFailed(ex) from ex
@@ -326,6 +320,11 @@ async def get_coordinator(
     return hass.data[DOMAIN][entry.entry_id]["coordinator"]
 
 
+def _flatten_data(data: dict) -> dict:
+    """Flatten the data of each appliance to pipe-delimited keys."""
+    return {ent: dict(flatdict.FlatterDict(data[ent], delimiter="|")) for ent in data}
+
+
 async def _setup_sensor_config(hass: HomeAssistant, config: ConfigType):
     """Set up sensors configuration."""
 
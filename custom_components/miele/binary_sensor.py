@@ -75,7 +75,7 @@ class MieleBinarySensorDefinition:
 
 BINARY_SENSOR_TYPES: Final[tuple[MieleBinarySensorDefinition, ...]] = (
     MieleBinarySensorDefinition(
-        types=[
+        types=(
             WASHING_MACHINE,
             TUMBLE_DRYER,
             TUMBLE_DRYER_SEMI_PROFESSIONAL,
@@ -95,7 +95,7 @@ BINARY_SENSOR_TYPES: Final[tuple[MieleBinarySensorDefinition, ...]] = (
             STEAM_OVEN_MICRO,
             WINE_CABINET_FREEZER,
             STEAM_OVEN_MK2,
-        ],
+        ),
         description=MieleBinarySensorDescription(
             key="door",
             data_tag="state|signalDoor",
@@ -104,7 +104,7 @@ BINARY_SENSOR_TYPES: Final[tuple[MieleBinarySensorDefinition, ...]] = (
         ),
     ),
     MieleBinarySensorDefinition(
-        types=[
+        types=(
             WASHING_MACHINE,
             TUMBLE_DRYER,
             TUMBLE_DRYER_SEMI_PROFESSIONAL,
@@ -129,7 +129,7 @@ BINARY_SENSOR_TYPES: Final[tuple[MieleBinarySensorDefinition, ...]] = (
             DIALOG_OVEN,
             WINE_CABINET_FREEZER,
             STEAM_OVEN_MK2,
-        ],
+        ),
         description=MieleBinarySensorDescription(
             key="info",
             data_tag="state|signalInfo",
@@ -139,7 +139,7 @@ BINARY_SENSOR_TYPES: Final[tuple[MieleBinarySensorDefinition, ...]] = (
         ),
     ),
     MieleBinarySensorDefinition(
-        types=[
+        types=(
             WASHING_MACHINE,
             TUMBLE_DRYER,
             TUMBLE_DRYER_SEMI_PROFESSIONAL,
@@ -167,7 +167,7 @@ BINARY_SENSOR_TYPES: Final[tuple[MieleBinarySensorDefinition, ...]] = (
             WINE_CABINET_FREEZER,
             STEAM_OVEN_MK2,
             HOB_INDUCT_EXTR,
-        ],
+        ),
         description=MieleBinarySensorDescription(
             key="failure",
             data_tag="state|signalFailure",
@@ -178,7 +178,7 @@ BINARY_SENSOR_TYPES: Final[tuple[MieleBinarySensorDefinition, ...]] = (
         ),
     ),
     MieleBinarySensorDefinition(
-        types=[
+        types=(
             WASHING_MACHINE,
             TUMBLE_DRYER,
             TUMBLE_DRYER_SEMI_PROFESSIONAL,
@@ -203,7 +203,7 @@ BINARY_SENSOR_TYPES: Final[tuple[MieleBinarySensorDefinition, ...]] = (
             WINE_CABINET_FREEZER,
             STEAM_OVEN_MK2,
             HOB_INDUCT_EXTR,
-        ],
+        ),
         description=MieleBinarySensorDescription(
             key="remoteEnable",
             data_tag="state|remoteEnable|fullRemoteControl",
@@ -213,7 +213,7 @@ BINARY_SENSOR_TYPES: Final[tuple[MieleBinarySensorDefinition, ...]] = (
         ),
     ),
     MieleBinarySensorDefinition(
-        types=[
+        types=(
             WASHING_MACHINE,
             TUMBLE_DRYER,
             TUMBLE_DRYER_SEMI_PROFESSIONAL,
@@ -238,7 +238,7 @@ BINARY_SENSOR_TYPES: Final[tuple[MieleBinarySensorDefinition, ...]] = (
             WINE_CABINET_FREEZER,
             STEAM_OVEN_MK2,
             HOB_INDUCT_EXTR,
-        ],
+        ),
         description=MieleBinarySensorDescription(
             key="smartGrid",
             data_tag="state|remoteEnable|smartGrid",
@@ -249,7 +249,7 @@ BINARY_SENSOR_TYPES: Final[tuple[MieleBinarySensorDefinition, ...]] = (
         ),
     ),
     MieleBinarySensorDefinition(
-        types=[
+        types=(
             WASHING_MACHINE,
             TUMBLE_DRYER,
             TUMBLE_DRYER_SEMI_PROFESSIONAL,
@@ -274,7 +274,7 @@ BINARY_SENSOR_TYPES: Final[tuple[MieleBinarySensorDefinition, ...]] = (
             WINE_CABINET_FREEZER,
             STEAM_OVEN_MK2,
             HOB_INDUCT_EXTR,
-        ],
+        ),
         description=MieleBinarySensorDescription(
             key="mobileStart",
             data_tag="state|remoteEnable|mobileStart",
@@ -296,9 +296,10 @@ async def async_setup_entry(
     coordinator = await get_coordinator(hass, config_entry)
 
     entities = []
-    for idx, ent in enumerate(coordinator.data):
+    for idx, (ent, data) in enumerate(coordinator.data.items()):
+        appliance_type = data["ident|type|value_raw"]
         for definition in BINARY_SENSOR_TYPES:
-            if coordinator.data[ent]["ident|type|value_raw"] in definition.types:
+            if appliance_type in definition.types:
                 entities.append(
                     MieleBinarySensor(coordinator, idx, ent, definition.description)
                 )
@@ -324,11 +325,11 @@ class MieleBinarySensor(CoordinatorEntity, BinarySensorEntity):
         self._ent = ent
         self.entity_description = description
         _LOGGER.debug("init sensor %s", ent)
-        appl_type = self.coordinator.data[self._ent][self.entity_description.type_key]
+        device = self.coordinator.data[self._ent]
+        tech_type = device["ident|deviceIdentLabel|techType"]
+        appl_type = device[self.entity_description.type_key]
         if appl_type == "":
-            appl_type = self.coordinator.data[self._ent][
-                "ident|deviceIdentLabel|techType"
-            ]
+            appl_type = tech_type
         self._attr_has_entity_name = True
         self._attr_unique_id = f"{self.entity_description.key}-{self._ent}"
         self._attr_device_info = DeviceInfo(
@@ -336,7 +337,7 @@ class MieleBinarySensor(CoordinatorEntity, BinarySensorEntity):
             serial_number=self._ent,
             name=appl_type,
             manufacturer=MANUFACTURER,
-            model=self.coordinator.data[self._ent]["ident|deviceIdentLabel|techType"],
+            model=tech_type,
         )
 
     @property
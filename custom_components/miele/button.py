@@ -65,7 +65,7 @@ class MieleButtonDefinition:
 
 BUTTON_TYPES: Final[tuple[MieleButtonDefinition, ...]] = (
     MieleButtonDefinition(
-        types=[
+        types=(
             WASHING_MACHINE,
             TUMBLE_DRYER,
             TUMBLE_DRYER_SEMI_PROFESSIONAL,
@@ -79,7 +79,7 @@ BUTTON_TYPES: Final[tuple[MieleButtonDefinition, ...]] = (
             STEAM_OVEN_MICRO,
             STEAM_OVEN_MK2,
             DIALOG_OVEN,
-        ],
+        ),
         description=MieleButtonDescription(
             key="start",
             translation_key="start",
@@ -87,7 +87,7 @@ BUTTON_TYPES: Final[tuple[MieleButtonDefinition, ...]] = (
         ),
     ),
     MieleButtonDefinition(
-        types=[
+        types=(
             WASHING_MACHINE,
             TUMBLE_DRYER,
             TUMBLE_DRYER_SEMI_PROFESSIONAL,
@@ -102,7 +102,7 @@ BUTTON_TYPES: Final[tuple[MieleButtonDefinition, ...]] = (
             STEAM_OVEN_MICRO,
             STEAM_OVEN_MK2,
             DIALOG_OVEN,
-        ],
+        ),
         description=MieleButtonDescription(
             key="stop",
             translation_key="stop",
@@ -121,9 +121,10 @@ async def async_setup_entry(
     coordinator = await get_coordinator(hass, config_entry)
 
     entities = []
-    for idx, ent in enumerate(coordinator.data):
+    for idx, (ent, data) in enumerate(coordinator.data.items()):
+        appliance_type = data["ident|type|value_raw"]
         for definition in BUTTON_TYPES:
-            if coordinator.data[ent]["ident|type|value_raw"] in definition.types:
+            if appliance_type in definition.types:
                 entities.append(
                     MieleButton(
                         coordinator,
@@ -161,11 +162,11 @@ class MieleButton(CoordinatorEntity, ButtonEntity):
         self._ent = ent
         self.entity_description = description
         _LOGGER.debug("init button %s", ent)
-        appl_type = self.coordinator.data[self._ent][self.entity_description.type_key]
+        device = self.coordinator.data[self._ent]
+        tech_type = device["ident|deviceIdentLabel|techType"]
+        appl_type = device[self.entity_description.type_key]
         if appl_type == "":
-            appl_type = self.coordinator.data[self._ent][
-                "ident|deviceIdentLabel|techType"
-            ]
+            appl_type = tech_type
         self._attr_has_entity_name = True
         self._attr_unique_id = f"{self.entity_description.key}-{self._ent}"
         self._attr_device_info = DeviceInfo(
@@ -173,7 +174,7 @@ class MieleButton(CoordinatorEntity, ButtonEntity):
             serial_number=self._ent,
             name=appl_type,
             manufacturer=MANUFACTURER,
-            model=self.coordinator.data[self._ent]["ident|deviceIdentLabel|techType"],
+            model=tech_type,
         )
 
     def _action_available(self, action) -> bool:
@@ -23,7 +23,14 @@ from homeassistant.helpers.update_coordinator import (
 )
 
 from . import get_coordinator
-from .const import ACTIONS, API, DOMAIN, MANUFACTURER, TARGET_TEMPERATURE
+from .const import (
+    ACTIONS,
+    API,
+    DOMAIN,
+    MANUFACTURER,
+    SENSOR_SENTINEL_VALUES,
+    TARGET_TEMPERATURE,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -56,7 +63,7 @@ class MieleClimateDefinition:
 
 CLIMATE_TYPES: Final[tuple[MieleClimateDefinition, ...]] = (
     MieleClimateDefinition(
-        types=[19, 20, 21, 32, 33, 34, 68],
+        types=(19, 20, 21, 32, 33, 34, 68),
         description=MieleClimateDescription(
             key="thermostat",
             current_temperature_tag="state|temperature|0|value_raw",
@@ -71,7 +78,7 @@ CLIMATE_TYPES: Final[tuple[MieleClimateDefinition, ...]] = (
         ),
     ),
     MieleClimateDefinition(
-        types=[19, 20, 21, 32, 33, 34, 68],
+        types=(19, 20, 21, 32, 33, 34, 68),
         description=MieleClimateDescription(
             key="thermostat",
             current_temperature_tag="state|temperature|1|value_raw",
@@ -86,7 +93,7 @@ CLIMATE_TYPES: Final[tuple[MieleClimateDefinition, ...]] = (
         ),
     ),
     MieleClimateDefinition(
-        types=[19, 20, 21, 32, 33, 34, 68],
+        types=(19, 20, 21, 32, 33, 34, 68),
         description=MieleClimateDescription(
             key="thermostat",
             current_temperature_tag="state|temperature|2|value_raw",
@@ -112,13 +119,12 @@ async def async_setup_entry(
     coordinator = await get_coordinator(hass, config_entry)
 
     entities = []
-    for idx, ent in enumerate(coordinator.data):
+    for idx, (ent, data) in enumerate(coordinator.data.items()):
+        appliance_type = data["ident|type|value_raw"]
         for definition in CLIMATE_TYPES:
             if (
-                coordinator.data[ent]["ident|type|value_raw"] in definition.types
-                and coordinator.data[ent].get(
-                    definition.description.target_temperature_tag, -32768
-                )
+                appliance_type in definition.types
+                and data.get(definition.description.target_temperature_tag, -32768)
                 != -32768
             ):
                 entities.append(
@@ -162,31 +168,19 @@ class MieleClimate(CoordinatorEntity, ClimateEntity):
         #   "Type: %s, Zone: %s",
         #   self.coordinator.data[self._ent]["ident|type|value_raw"], self._ed.zone,
         # )
-        appl_type = self.coordinator.data[self._ent][self._ed.type_key]
+        device = self.coordinator.data[self._ent]
+        tech_type = device["ident|deviceIdentLabel|techType"]
+        appl_type = device[self._ed.type_key]
         if appl_type == "":
-            appl_type = self.coordinator.data[self._ent][
-                "ident|deviceIdentLabel|techType"
-            ]
+            appl_type = tech_type
 
-        if (
-            self.coordinator.data[self._ent]["ident|type|value_raw"] == 21
-            and self._ed.zone == 0
-        ):
+        if device["ident|type|value_raw"] == 21 and self._ed.zone == 0:
             name = "fridge"
-        elif (
-            self.coordinator.data[self._ent]["ident|type|value_raw"] == 21
-            and self._ed.zone == 1
-        ):
+        elif device["ident|type|value_raw"] == 21 and self._ed.zone == 1:
             name = "freezer"
-        elif (
-            self.coordinator.data[self._ent]["ident|type|value_raw"] == 19
-            and self._ed.zone == 0
-        ):
+        elif device["ident|type|value_raw"] == 19 and self._ed.zone == 0:
             name = "fridge"
-        elif (
-            self.coordinator.data[self._ent]["ident|type|value_raw"] == 20
-            and self._ed.zone == 0
-        ):
+        elif device["ident|type|value_raw"] == 20 and self._ed.zone == 0:
             name = "freezer"
         else:
             name = self._ed.name
@@ -221,31 +215,24 @@ class MieleClimate(CoordinatorEntity, ClimateEntity):
             serial_number=self._ent,
             name=appl_type,
             manufacturer=MANUFACTURER,
-            model=self.coordinator.data[self._ent]["ident|deviceIdentLabel|techType"],
+            model=tech_type,
         )
 
     @property
     def current_temperature(self):
         """Return the current temperature."""
-        return round(
-            self.coordinator.data[self._ent][self._ed.current_temperature_tag] / 100,
-            1,
-        )
+        raw = self.coordinator.data[self._ent].get(self._ed.current_temperature_tag)
+        if raw is None or raw in SENSOR_SENTINEL_VALUES:
+            return None
+        return raw / 100
 
     @property
     def target_temperature(self):
         """Return the target temperature."""
-        if self.coordinator.data[self._ent].get(
-            "self._ed.target_temperature_tag", -32768
-        ) in (
-            -32766,
-            -32768,
-        ):
+        raw = self.coordinator.data[self._ent].get(self._ed.target_temperature_tag)
+        if raw is None or raw in SENSOR_SENTINEL_VALUES:
             return None
-        return round(
-            self.coordinator.data[self._ent][self._ed.target_temperature_tag] / 100,
-            1,
-        )
+        return raw / 100
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature."""
@@ -128,6 +128,9 @@ STATE_STATUS_SUPERHEATING = 15
 STATE_STATUS_SUPERCOOLING_SUPERFREEZING = 146
 STATE_STATUS_NOT_CONNECTED = 255
 
+# Raw values reported by the API when a value is not available
+SENSOR_SENTINEL_VALUES = frozenset({-32766, -32768})
+
 # Define various states
 STATE_STATUS = {
     0: "reserved",
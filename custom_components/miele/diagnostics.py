@@ -47,7 +47,7 @@ async def async_get_config_entry_diagnostics(
         "info": async_redact_data(config_entry.data, TO_REDACT),
         "data": async_redact_data(device_data, TO_REDACT),
         "actions": async_redact_data(action_data, TO_REDACT),
-        "id_log": hass.data[DOMAIN]["id_log"],
+        "id_log": list(hass.data[DOMAIN]["id_log"]),
     }
 
     return diagnostics_data
@@ -103,7 +103,7 @@ async def async_get_device_diagnostics(
         "data": async_redact_data(device_data, TO_REDACT),
         "actions": async_redact_data(action_data, TO_REDACT),
         "programs": program_data,
-        "id_log": hass.data[DOMAIN]["id_log"],
+        "id_log": list(hass.data[DOMAIN]["id_log"]),
         "local_mappings": local_mappings,
     }
 
@@ -68,9 +68,7 @@ class MieleFanDefinition:
 
 FAN_TYPES: Final[tuple[MieleFanDefinition, ...]] = (
     MieleFanDefinition(
-        types=[
-            HOOD,
-        ],
+        types=(HOOD,),
         description=MieleFanDescription(
             key="fan",
             ventilation_step_tag="state|ventilationStep|value_raw",
@@ -80,9 +78,7 @@ FAN_TYPES: Final[tuple[MieleFanDefinition, ...]] = (
         ),
     ),
     MieleFanDefinition(
-        types=[
-            HOB_INDUCT_EXTR,
-        ],
+        types=(HOB_INDUCT_EXTR,),
         description=MieleFanDescription(
             key="fan",
             ventilation_step_tag="state|ventilationStep|value_raw",
@@ -103,9 +99,10 @@ async def async_setup_entry(
     coordinator = await get_coordinator(hass, config_entry)
 
     entities = []
-    for idx, ent in enumerate(coordinator.data):
+    for idx, (ent, data) in enumerate(coordinator.data.items()):
+        appliance_type = data["ident|type|value_raw"]
         for definition in FAN_TYPES:
-            if coordinator.data[ent]["ident|type|value_raw"] in definition.types:
+            if appliance_type in definition.types:
                 entities.append(
                     MieleFan(
                         coordinator,
@@ -142,11 +139,11 @@ class MieleFan(CoordinatorEntity, FanEntity):
         self._ent = ent
         self.entity_description = description
         _LOGGER.debug("Init fan %s", ent)
-        appl_type = self.coordinator.data[self._ent][self.entity_description.type_key]
+        device = self.coordinator.data[self._ent]
+        tech_type = device["ident|deviceIdentLabel|techType"]
+        appl_type = device[self.entity_description.type_key]
         if appl_type == "":
-            appl_type = self.coordinator.data[self._ent][
-                "ident|deviceIdentLabel|techType"
-            ]
+            appl_type = tech_type
         self._attr_has_entity_name = True
         self._attr_unique_id = f"{self.entity_description.key}-{self._ent}"
         self._attr_supported_features = self.entity_description.supported_features
@@ -155,7 +152,7 @@ class MieleFan(CoordinatorEntity, FanEntity):
             serial_number=self._ent,
             name=appl_type,
             manufacturer=MANUFACTURER,
-            model=self.coordinator.data[self._ent]["ident|deviceIdentLabel|techType"],
+            model=tech_type,
         )
 
     @property
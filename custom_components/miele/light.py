@@ -66,7 +66,7 @@ class MieleLightDefinition:
 
 LIGHT_TYPES: Final[tuple[MieleLightDefinition, ...]] = (
     MieleLightDefinition(
-        types=[
+        types=(
             OVEN,
             OVEN_MICROWAVE,
             STEAM_OVEN,
@@ -80,7 +80,7 @@ LIGHT_TYPES: Final[tuple[MieleLightDefinition, ...]] = (
             STEAM_OVEN_MICRO,
             WINE_CABINET_FREEZER,
             STEAM_OVEN_MK2,
-        ],
+        ),
         description=MieleLightDescription(
             key="light",
             light_tag="state|light",
@@ -88,9 +88,7 @@ LIGHT_TYPES: Final[tuple[MieleLightDefinition, ...]] = (
         ),
     ),
     MieleLightDefinition(
-        types=[
-            HOOD,
-        ],
+        types=(HOOD,),
         description=MieleLightDescription(
             key="ambientlight",
             light_tag="state|ambientLight",
@@ -109,9 +107,10 @@ async def async_setup_entry(
     coordinator = await get_coordinator(hass, config_entry)
 
     entities = []
-    for idx, ent in enumerate(coordinator.data):
+    for idx, (ent, data) in enumerate(coordinator.data.items()):
+        appliance_type = data["ident|type|value_raw"]
         for definition in LIGHT_TYPES:
-            if coordinator.data[ent]["ident|type|value_raw"] in definition.types:
+            if appliance_type in definition.types:
                 entities.append(
                     MieleLight(
                         coordinator,
@@ -148,11 +147,11 @@ class MieleLight(CoordinatorEntity, LightEntity):
         self._ent = ent
         self.entity_description = description
         _LOGGER.debug("Init light %s", ent)
-        appl_type = self.coordinator.data[self._ent][self.entity_description.type_key]
+        device = self.coordinator.data[self._ent]
+        tech_type = device["ident|deviceIdentLabel|techType"]
+        appl_type = device[self.entity_description.type_key]
         if appl_type == "":
-            appl_type = self.coordinator.data[self._ent][
-                "ident|deviceIdentLabel|techType"
-            ]
+            appl_type = tech_type
         self._attr_has_entity_name = True
         self._attr_unique_id = f"{self.entity_description.key}-{self._ent}"
         self._attr_supported_features = self.entity_description.supported_features
@@ -161,7 +160,7 @@ class MieleLight(CoordinatorEntity, LightEntity):
             serial_number=self._ent,
             name=appl_type,
             manufacturer=MANUFACTURER,
-            model=self.coordinator.data[self._ent]["ident|deviceIdentLabel|techType"],
+            model=tech_type,
         )
 
     @property
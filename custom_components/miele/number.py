@@ -197,8 +197,9 @@ class MieleNumber(CoordinatorEntity, NumberEntity):
         self.entity_description = description
         self._ed = description
         _LOGGER.debug("Init number %s", ent)
-        appl_type = self.coordinator.data[self._ent][self._ed.type_key]
-        tech_type = self.coordinator.data[self._ent]["ident|deviceIdentLabel|techType"]
+        device = self.coordinator.data[self._ent]
+        appl_type = device[self._ed.type_key]
+        tech_type = device["ident|deviceIdentLabel|techType"]
         if appl_type == "":
             appl_type = tech_type
         self._attr_has_entity_name = True
@@ -209,7 +210,7 @@ class MieleNumber(CoordinatorEntity, NumberEntity):
             serial_number=self._ent,
             name=appl_type,
             manufacturer=MANUFACTURER,
-            model=self.coordinator.data[self._ent]["ident|deviceIdentLabel|techType"],
+            model=tech_type,
         )
 
     @property
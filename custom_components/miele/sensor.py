@@ -5,8 +5,10 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from dataclasses import dataclass
-from datetime import timedelta
+from datetime import datetime, timedelta
+from functools import cached_property
 import logging
+from operator import itemgetter
 from typing import Any, Final
 
 from homeassistant.components.sensor import (
@@ -22,7 +24,7 @@ from homeassistant.const import (
     UnitOfTime,
     UnitOfVolume,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo, EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import ConfigType
@@ -54,6 +56,7 @@ from .const import (
     OVEN,
     OVEN_MICROWAVE,
     ROBOT_VACUUM_CLEANER,
+    SENSOR_SENTINEL_VALUES,
     STATE_DRYING_STEP,
     STATE_PROGRAM_ID,
     STATE_PROGRAM_PHASE,
@@ -83,6 +86,151 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Appliance types shared by several sensor definitions
+_TEMPERATURE_TYPES: Final[frozenset[int]] = frozenset(
+    {
+        TUMBLE_DRYER_SEMI_PROFESSIONAL,
+        OVEN,
+        OVEN_MICROWAVE,
+        STEAM_OVEN,
+        MICROWAVE,
+        FRIDGE,
+        FREEZER,
+        FRIDGE_FREEZER,
+        STEAM_OVEN_COMBI,
+        WINE_CABINET,
+        WINE_CONDITIONING_UNIT,
+        WINE_STORAGE_CONDITIONING_UNIT,
+        STEAM_OVEN_MICRO,
+        DIALOG_OVEN,
+        WINE_CABINET_FREEZER,
+        STEAM_OVEN_MK2,
+    }
+)
+_TARGET_TEMPERATURE_TYPES: Final[frozenset[int]] = frozenset(
+    {
+        WASHING_MACHINE,
+        OVEN,
+        OVEN_MICROWAVE,
+        STEAM_OVEN,
+        MICROWAVE,
+        FRIDGE,
+        FREEZER,
+        FRIDGE_FREEZER,
+        WASHER_DRYER,
+        STEAM_OVEN_COMBI,
+        WINE_CABINET,
+        WINE_CONDITIONING_UNIT,
+        WINE_STORAGE_CONDITIONING_UNIT,
+        STEAM_OVEN_MICRO,
+        DIALOG_OVEN,
+        WINE_CABINET_FREEZER,
+        STEAM_OVEN_MK2,
+    }
+)
+_PROGRAM_TYPES: Final[frozenset[int]] = frozenset(
+    {
+        WASHING_MACHINE,
+        TUMBLE_DRYER,
+        TUMBLE_DRYER_SEMI_PROFESSIONAL,
+        DISHWASHER,
+        OVEN,
+        OVEN_MICROWAVE,
+        STEAM_OVEN,
+        MICROWAVE,
+        COFFEE_SYSTEM,
+        ROBOT_VACUUM_CLEANER,
+        WASHER_DRYER,
+        STEAM_OVEN_COMBI,
+        STEAM_OVEN_MICRO,
+        DIALOG_OVEN,
+        STEAM_OVEN_MK2,
+    }
+)
+_REMAINING_TIME_TYPES: Final[frozenset[int]] = frozenset(
+    {
+        WASHING_MACHINE,
+        TUMBLE_DRYER,
+        TUMBLE_DRYER_SEMI_PROFESSIONAL,
+        DISHWASHER,
+        OVEN,
+        OVEN_MICROWAVE,
+        STEAM_OVEN,
+        MICROWAVE,
+        ROBOT_VACUUM_CLEANER,
+        WASHER_DRYER,
+        STEAM_OVEN_COMBI,
+        STEAM_OVEN_MICRO,
+        DIALOG_OVEN,
+        STEAM_OVEN_MK2,
+    }
+)
+_START_TIME_TYPES: Final[frozenset[int]] = frozenset(
+    {
+        WASHING_MACHINE,
+        TUMBLE_DRYER,
+        TUMBLE_DRYER_SEMI_PROFESSIONAL,
+        DISHWASHER,
+        OVEN,
+        OVEN_MICROWAVE,
+        STEAM_OVEN,
+        MICROWAVE,
+        WASHER_DRYER,
+        STEAM_OVEN_COMBI,
+        STEAM_OVEN_MICRO,
+        DIALOG_OVEN,
+        STEAM_OVEN_MK2,
+    }
+)
+_ELAPSED_TIME_TYPES: Final[frozenset[int]] = frozenset(
+    {
+        WASHING_MACHINE,
+        TUMBLE_DRYER,
+        DISHWASHER,
+        OVEN,
+        OVEN_MICROWAVE,
+        STEAM_OVEN,
+        MICROWAVE,
+        WASHER_DRYER,
+        STEAM_OVEN_COMBI,
+        STEAM_OVEN_MICRO,
+        DIALOG_OVEN,
+        ROBOT_VACUUM_CLEANER,
+        STEAM_OVEN_MK2,
+    }
+)
+_WATER_TYPES: Final[frozenset[int]] = frozenset(
+    {
+        WASHING_MACHINE,
+        DISHWASHER,
+        WASHER_DRYER,
+    }
+)
+_ENERGY_TYPES: Final[frozenset[int]] = frozenset(
+    {
+        WASHING_MACHINE,
+        TUMBLE_DRYER,
+        TUMBLE_DRYER_SEMI_PROFESSIONAL,
+        DISHWASHER,
+        WASHER_DRYER,
+    }
+)
+_CORE_TEMPERATURE_TYPES: Final[frozenset[int]] = frozenset(
+    {
+        OVEN,
+        OVEN_MICROWAVE,
+        STEAM_OVEN_COMBI,
+        STEAM_OVEN_MK2,
+    }
+)
+_HOB_TYPES: Final[frozenset[int]] = frozenset(
+    {
+        HOB_INDUCTION,
+        HOB_HIGHLIGHT,
+        HOB_INDUCT_EXTR,
+    }
+)
+
 
 @dataclass
 class MieleSensorDescription(SensorEntityDescription):
@@ -102,34 +250,59 @@ class MieleSensorDescription(SensorEntityDescription):
     extra_attributes: dict[str, Any] | None = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MieleSensorDefinition:
     """Class for defining sensor entities."""
 
-    types: tuple[int, ...]
+    types: frozenset[int]
     description: MieleSensorDescription = None
 
 
+@dataclass(slots=True)
+class _UpdateTime:
+    """Time of the last coordinator update, shared by the time sensors."""
+
+    now: datetime | None = None
+
+
+_CONSUMPTION_KEYS: Final = frozenset(
+    {"stateCurrentEnergyConsumption", "stateCurrentWaterConsumption"}
+)
+# Appliance states in which consumption is reported as 0
+_NOT_RUNNING_STATES: Final = frozenset(
+    {
+        STATE_STATUS_ON,
+        STATE_STATUS_OFF,
+        STATE_STATUS_PROGRAMMED,
+        STATE_STATUS_WAITING_TO_START,
+        STATE_STATUS_IDLE,
+        STATE_STATUS_SERVICE,
+    }
+)
+_PROGRAM_LOG_KEYS: Final = frozenset(
+    {"stateProgramPhase", "stateProgramId", "stateProgramType"}
+)
+_PROGRAM_ID_PHASE_KEYS: Final = frozenset({"stateProgramId", "stateProgramPhase"})
+
+
+def _convert_centi(value, appliance_type):
+    """Convert a value reported in hundredths."""
+    return value / 100.0
+
+
+def _convert_centi_int(value, appliance_type):
+    """Convert a value reported in hundredths to whole units."""
+    return int(value / 100.0)
+
+
+def _convert_percentage(value, appliance_type):
+    """Convert a ratio to a percentage."""
+    return value * 100.0
+
+
 SENSOR_TYPES: Final[tuple[MieleSensorDefinition, ...]] = (
     MieleSensorDefinition(
-        types=[
-            TUMBLE_DRYER_SEMI_PROFESSIONAL,
-            OVEN,
-            OVEN_MICROWAVE,
-            STEAM_OVEN,
-            MICROWAVE,
-            FRIDGE,
-            FREEZER,
-            FRIDGE_FREEZER,
-            STEAM_OVEN_COMBI,
-            WINE_CABINET,
-            WINE_CONDITIONING_UNIT,
-            WINE_STORAGE_CONDITIONING_UNIT,
-            STEAM_OVEN_MICRO,
-            DIALOG_OVEN,
-            WINE_CABINET_FREEZER,
-            STEAM_OVEN_MK2,
-        ],
+        types=_TEMPERATURE_TYPES,
         description=MieleSensorDescription(
             key="temperature",
             data_tag="state|temperature|0|value_raw",
@@ -137,28 +310,11 @@ SENSOR_TYPES: Final[tuple[MieleSensorDefinition, ...]] = (
             translation_key="temperature",
             native_unit_of_measurement=UnitOfTemperature.CELSIUS,
             state_class=SensorStateClass.MEASUREMENT,
-            convert=lambda x, t: x / 100.0,
+            convert=_convert_centi,
         ),
     ),
     MieleSensorDefinition(
-        types=[
-            TUMBLE_DRYER_SEMI_PROFESSIONAL,
-            OVEN,
-            OVEN_MICROWAVE,
-            STEAM_OVEN,
-            MICROWAVE,
-            FRIDGE,
-            FREEZER,
-            FRIDGE_FREEZER,
-            STEAM_OVEN_COMBI,
-            WINE_CABINET,
-            WINE_CONDITIONING_UNIT,
-            WINE_STORAGE_CONDITIONING_UNIT,
-            STEAM_OVEN_MICRO,
-            DIALOG_OVEN,
-            WINE_CABINET_FREEZER,
-            STEAM_OVEN_MK2,
-        ],
+        types=_TEMPERATURE_TYPES,
         description=MieleSensorDescription(
             key="temperature2",
             data_tag="state|temperature|1|value_raw",
@@ -166,28 +322,30 @@ SENSOR_TYPES: Final[tuple[MieleSensorDefinition, ...]] = (
             translation_key="temperature_zone_2",
             native_unit_of_measurement=UnitOfTemperature.CELSIUS,
             state_class=SensorStateClass.MEASUREMENT,
-            convert=lambda x, t: x / 100.0,
+            convert=_convert_centi,
             entity_registry_enabled_default=False,
         ),
     ),
     MieleSensorDefinition(
-        types=[
-            OVEN,
-            OVEN_MICROWAVE,
-            STEAM_OVEN,
-            MICROWAVE,
-            FRIDGE,
-            FREEZER,
-            FRIDGE_FREEZER,
-            STEAM_OVEN_COMBI,
-            WINE_CABINET,
-            WINE_CONDITIONING_UNIT,
-            WINE_STORAGE_CONDITIONING_UNIT,
-            STEAM_OVEN_MICRO,
-            DIALOG_OVEN,
-            WINE_CABINET_FREEZER,
-            STEAM_OVEN_MK2,
-        ],
+        types=frozenset(
+            {
+                OVEN,
+                OVEN_MICROWAVE,
+                STEAM_OVEN,
+                MICROWAVE,
+                FRIDGE,
+                FREEZER,
+                FRIDGE_FREEZER,
+                STEAM_OVEN_COMBI,
+                WINE_CABINET,
+                WINE_CONDITIONING_UNIT,
+                WINE_STORAGE_CONDITIONING_UNIT,
+                STEAM_OVEN_MICRO,
+                DIALOG_OVEN,
+                WINE_CABINET_FREEZER,
+                STEAM_OVEN_MK2,
+            }
+        ),
         description=MieleSensorDescription(
             key="temperature3",
             data_tag="state|temperature|2|value_raw",
@@ -195,30 +353,12 @@ SENSOR_TYPES: Final[tuple[MieleSensorDefinition, ...]] = (
             translation_key="temperature_zone_3",
             native_unit_of_measurement=UnitOfTemperature.CELSIUS,
             state_class=SensorStateClass.MEASUREMENT,
-            convert=lambda x, t: x / 100.0,
+            convert=_convert_centi,
             entity_registry_enabled_default=False,
         ),
     ),
     MieleSensorDefinition(
-        types=[
-            WASHING_MACHINE,
-            OVEN,
-            OVEN_MICROWAVE,
-            STEAM_OVEN,
-            MICROWAVE,
-            FRIDGE,
-            FREEZER,
-            FRIDGE_FREEZER,
-            WASHER_DRYER,
-            STEAM_OVEN_COMBI,
-            WINE_CABINET,
-            WINE_CONDITIONING_UNIT,
-            WINE_STORAGE_CONDITIONING_UNIT,
-            STEAM_OVEN_MICRO,
-            DIALOG_OVEN,
-            WINE_CABINET_FREEZER,
-            STEAM_OVEN_MK2,
-        ],
+        types=_TARGET_TEMPERATURE_TYPES,
         description=MieleSensorDescription(
             key="targetTemperature",
             data_tag="state|targetTemperature|0|value_raw",
@@ -226,29 +366,11 @@ SENSOR_TYPES: Final[tuple[MieleSensorDefinition, ...]] = (
             translation_key="target_temperature",
             native_unit_of_measurement=UnitOfTemperature.CELSIUS,
             entity_category=EntityCategory.DIAGNOSTIC,
-            convert=lambda x, t: int(x / 100.0),
+            convert=_convert_centi_int,
         ),
     ),
     MieleSensorDefinition(
-        types=[
-            WASHING_MACHINE,
-            OVEN,
-            OVEN_MICROWAVE,
-            STEAM_OVEN,
-            MICROWAVE,
-            FRIDGE,
-            FREEZER,
-            FRIDGE_FREEZER,
-            WASHER_DRYER,
-            STEAM_OVEN_COMBI,
-            WINE_CABINET,
-            WINE_CONDITIONING_UNIT,
-            WINE_STORAGE_CONDITIONING_UNIT,
-            STEAM_OVEN_MICRO,
-            DIALOG_OVEN,
-            WINE_CABINET_FREEZER,
-            STEAM_OVEN_MK2,
-        ],
+        types=_TARGET_TEMPERATURE_TYPES,
         description=MieleSensorDescription(
             key="targetTemperature2",
             data_tag="state|targetTemperature|1|value_raw",
@@ -256,30 +378,12 @@ SENSOR_TYPES: Final[tuple[MieleSensorDefinition, ...]] = (
             translation_key="target_temperature_zone_2",
             native_unit_of_measurement=UnitOfTemperature.CELSIUS,
             entity_category=EntityCategory.DIAGNOSTIC,
-            convert=lambda x, t: int(x / 100.0),
+            convert=_convert_centi_int,
             entity_registry_enabled_default=False,
         ),
     ),
     MieleSensorDefinition(
-        types=[
-            WASHING_MACHINE,
-            OVEN,
-            OVEN_MICROWAVE,
-            STEAM_OVEN,
-            MICROWAVE,
-            FRIDGE,
-            FREEZER,
-            FRIDGE_FREEZER,
-            WASHER_DRYER,
-            STEAM_OVEN_COMBI,
-            WINE_CABINET,
-            WINE_CONDITIONING_UNIT,
-            WINE_STORAGE_CONDITIONING_UNIT,
-            STEAM_OVEN_MICRO,
-            DIALOG_OVEN,
-            WINE_CABINET_FREEZER,
-            STEAM_OVEN_MK2,
-        ],
+        types=_TARGET_TEMPERATURE_TYPES,
         description=MieleSensorDescription(
             key="targetTemperature3",
             data_tag="state|targetTemperature|2|value_raw",
@@ -287,40 +391,42 @@ SENSOR_TYPES: Final[tuple[MieleSensorDefinition, ...]] = (
             translation_key="target_temperature_zone_3",
             native_unit_of_measurement=UnitOfTemperature.CELSIUS,
             entity_category=EntityCategory.DIAGNOSTIC,
-            convert=lambda x, t: int(x / 100.0),
+            convert=_convert_centi_int,
             entity_registry_enabled_default=False,
         ),
     ),
     MieleSensorDefinition(
-        types=[
-            WASHING_MACHINE,
-            TUMBLE_DRYER,
-            TUMBLE_DRYER_SEMI_PROFESSIONAL,
-            DISHWASHER,
-            OVEN,
-            OVEN_MICROWAVE,
-            HOB_HIGHLIGHT,
-            STEAM_OVEN,
-            MICROWAVE,
-            COFFEE_SYSTEM,
-            HOOD,
-            FRIDGE,
-            FREEZER,
-            FRIDGE_FREEZER,
-            ROBOT_VACUUM_CLEANER,
-            WASHER_DRYER,
-            DISH_WARMER,
-            HOB_INDUCTION,
-            STEAM_OVEN_COMBI,
-            WINE_CABINET,
-            WINE_CONDITIONING_UNIT,
-            WINE_STORAGE_CONDITIONING_UNIT,
-            STEAM_OVEN_MICRO,
-            DIALOG_OVEN,
-            WINE_CABINET_FREEZER,
-            STEAM_OVEN_MK2,
-            HOB_INDUCT_EXTR,
-        ],
+        types=frozenset(
+            {
+                WASHING_MACHINE,
+                TUMBLE_DRYER,
+                TUMBLE_DRYER_SEMI_PROFESSIONAL,
+                DISHWASHER,
+                OVEN,
+                OVEN_MICROWAVE,
+                HOB_HIGHLIGHT,
+                STEAM_OVEN,
+                MICROWAVE,
+                COFFEE_SYSTEM,
+                HOOD,
+                FRIDGE,
+                FREEZER,
+                FRIDGE_FREEZER,
+                ROBOT_VACUUM_CLEANER,
+                WASHER_DRYER,
+                DISH_WARMER,
+                HOB_INDUCTION,
+                STEAM_OVEN_COMBI,
+                WINE_CABINET,
+                WINE_CONDITIONING_UNIT,
+                WINE_STORAGE_CONDITIONING_UNIT,
+                STEAM_OVEN_MICRO,
+                DIALOG_OVEN,
+                WINE_CABINET_FREEZER,
+                STEAM_OVEN_MK2,
+                HOB_INDUCT_EXTR,
+            }
+        ),
         description=MieleSensorDescription(
             key="stateStatus",
             data_tag="state|status|value_raw",
@@ -339,23 +445,7 @@ SENSOR_TYPES: Final[tuple[MieleSensorDefinition, ...]] = (
         ),
     ),
     MieleSensorDefinition(
-        types=[
-            WASHING_MACHINE,
-            TUMBLE_DRYER,
-            TUMBLE_DRYER_SEMI_PROFESSIONAL,
-            DISHWASHER,
-            OVEN,
-            OVEN_MICROWAVE,
-            STEAM_OVEN,
-            MICROWAVE,
-            COFFEE_SYSTEM,
-            ROBOT_VACUUM_CLEANER,
-            WASHER_DRYER,
-            STEAM_OVEN_COMBI,
-            STEAM_OVEN_MICRO,
-            DIALOG_OVEN,
-            STEAM_OVEN_MK2,
-        ],
+        types=_PROGRAM_TYPES,
         description=MieleSensorDescription(
             key="stateProgramId",
             data_tag="state|ProgramID|value_raw",
@@ -368,23 +458,7 @@ SENSOR_TYPES: Final[tuple[MieleSensorDefinition, ...]] = (
         ),
     ),
     MieleSensorDefinition(
-        types=[
-            WASHING_MACHINE,
-            TUMBLE_DRYER,
-            TUMBLE_DRYER_SEMI_PROFESSIONAL,
-            DISHWASHER,
-            OVEN,
-            OVEN_MICROWAVE,
-            STEAM_OVEN,
-            MICROWAVE,
-            ROBOT_VACUUM_CLEANER,
-            WASHER_DRYER,
-            STEAM_OVEN_COMBI,
-            STEAM_OVEN_MICRO,
-            DIALOG_OVEN,
-            COFFEE_SYSTEM,
-            STEAM_OVEN_MK2,
-        ],
+        types=_PROGRAM_TYPES,
         description=MieleSensorDescription(
             key="stateProgramType",
             data_tag="state|programType|value_raw",
@@ -397,23 +471,7 @@ SENSOR_TYPES: Final[tuple[MieleSensorDefinition, ...]] = (
         ),
     ),
     MieleSensorDefinition(
-        types=[
-            WASHING_MACHINE,
-            TUMBLE_DRYER,
-            TUMBLE_DRYER_SEMI_PROFESSIONAL,
-            DISHWASHER,
-            OVEN,
-            OVEN_MICROWAVE,
-            STEAM_OVEN,
-            MICROWAVE,
-            COFFEE_SYSTEM,
-            ROBOT_VACUUM_CLEANER,
-            WASHER_DRYER,
-            STEAM_OVEN_COMBI,
-            STEAM_OVEN_MICRO,
-            DIALOG_OVEN,
-            STEAM_OVEN_MK2,
-        ],
+        types=_PROGRAM_TYPES,
         description=MieleSensorDescription(
             key="stateProgramPhase",
             data_tag="state|programPhase|value_raw",
@@ -425,10 +483,12 @@ SENSOR_TYPES: Final[tuple[MieleSensorDefinition, ...]] = (
         ),
     ),
     MieleSensorDefinition(
-        types=[
-            WASHING_MACHINE,
-            WASHER_DRYER,
-        ],
+        types=frozenset(
+            {
+                WASHING_MACHINE,
+                WASHER_DRYER,
+            }
+        ),
         description=MieleSensorDescription(
             key="stateSpinningSpeed",
             data_tag="state|spinningSpeed|value_raw",
@@ -439,11 +499,13 @@ SENSOR_TYPES: Final[tuple[MieleSensorDefinition, ...]] = (
         ),
     ),
     MieleSensorDefinition(
-        types=[
-            WASHER_DRYER,
-            TUMBLE_DRYER,
-            TUMBLE_DRYER_SEMI_PROFESSIONAL,
-        ],
+        types=frozenset(
+            {
+                WASHER_DRYER,
+                TUMBLE_DRYER,
+                TUMBLE_DRYER_SEMI_PROFESSIONAL,
+            }
+        ),
         description=MieleSensorDescription(
             key="stateDryingStep",
             data_tag="state|dryingStep|value_raw",
@@ -456,22 +518,7 @@ SENSOR_TYPES: Final[tuple[MieleSensorDefinition, ...]] = (
         ),
     ),
     MieleSensorDefinition(
-        types=[
-            WASHING_MACHINE,
-            TUMBLE_DRYER,
-            TUMBLE_DRYER_SEMI_PROFESSIONAL,
-            DISHWASHER,
-            OVEN,
-            OVEN_MICROWAVE,
-            STEAM_OVEN,
-            MICROWAVE,
-            ROBOT_VACUUM_CLEANER,
-            WASHER_DRYER,
-            STEAM_OVEN_COMBI,
-            STEAM_OVEN_MICRO,
-            DIALOG_OVEN,
-            STEAM_OVEN_MK2,
-        ],
+        types=_REMAINING_TIME_TYPES,
         description=MieleSensorDescription(
             key="stateRemainingTime",
             data_tag="state|remainingTime|0",
@@ -483,22 +530,7 @@ SENSOR_TYPES: Final[tuple[MieleSensorDefinition, ...]] = (
         ),
     ),
     MieleSensorDefinition(
-        types=[
-            WASHING_MACHINE,
-            TUMBLE_DRYER,
-            TUMBLE_DRYER_SEMI_PROFESSIONAL,
-            DISHWASHER,
-            OVEN,
-            OVEN_MICROWAVE,
-            STEAM_OVEN,
-            MICROWAVE,
-            WASHER_DRYER,
-            STEAM_OVEN_COMBI,
-            STEAM_OVEN_MICRO,
-            DIALOG_OVEN,
-            ROBOT_VACUUM_CLEANER,
-            STEAM_OVEN_MK2,
-        ],
+        types=_REMAINING_TIME_TYPES,
         description=MieleSensorDescription(
             key="stateRemainingTimeAbs",
             data_tag="state|remainingTime|0",
@@ -512,21 +544,7 @@ SENSOR_TYPES: Final[tuple[MieleSensorDefinition, ...]] = (
         ),
     ),
     MieleSensorDefinition(
-        types=[
-            WASHING_MACHINE,
-            TUMBLE_DRYER,
-            TUMBLE_DRYER_SEMI_PROFESSIONAL,
-            DISHWASHER,
-            OVEN,
-            OVEN_MICROWAVE,
-            STEAM_OVEN,
-            MICROWAVE,
-            WASHER_DRYER,
-            STEAM_OVEN_COMBI,
-            STEAM_OVEN_MICRO,
-            DIALOG_OVEN,
-            STEAM_OVEN_MK2,
-        ],
+        types=_START_TIME_TYPES,
         description=MieleSensorDescription(
             key="stateStartTime",
             data_tag="state|startTime|0",
@@ -538,21 +556,7 @@ SENSOR_TYPES: Final[tuple[MieleSensorDefinition, ...]] = (
         ),
     ),
     MieleSensorDefinition(
-        types=[
-            WASHING_MACHINE,
-            TUMBLE_DRYER,
-            TUMBLE_DRYER_SEMI_PROFESSIONAL,
-            DISHWASHER,
-            OVEN,
-            OVEN_MICROWAVE,
-            STEAM_OVEN,
-            MICROWAVE,
-            WASHER_DRYER,
-            STEAM_OVEN_COMBI,
-            STEAM_OVEN_MICRO,
-            DIALOG_OVEN,
-            STEAM_OVEN_MK2,
-        ],
+        types=_START_TIME_TYPES,
         description=MieleSensorDescription(
             key="stateStartTimeAbs",
             data_tag="state|startTime|0",
@@ -563,21 +567,7 @@ SENSOR_TYPES: Final[tuple[MieleSensorDefinition, ...]] = (
         ),
     ),
     MieleSensorDefinition(
-        types=[
-            WASHING_MACHINE,
-            TUMBLE_DRYER,
-            DISHWASHER,
-            OVEN,
-            OVEN_MICROWAVE,
-            STEAM_OVEN,
-            MICROWAVE,
-            WASHER_DRYER,
-            STEAM_OVEN_COMBI,
-            STEAM_OVEN_MICRO,
-            DIALOG_OVEN,
-            ROBOT_VACUUM_CLEANER,
-            STEAM_OVEN_MK2,
-        ],
+        types=_ELAPSED_TIME_TYPES,
         description=MieleSensorDescription(
             key="stateElapsedTime",
             data_tag="state|elapsedTime|0",
@@ -589,21 +579,7 @@ SENSOR_TYPES: Final[tuple[MieleSensorDefinition, ...]] = (
         ),
     ),
     MieleSensorDefinition(
-        types=[
-            WASHING_MACHINE,
-            TUMBLE_DRYER,
-            DISHWASHER,
-            OVEN,
-            OVEN_MICROWAVE,
-            STEAM_OVEN,
-            MICROWAVE,
-            WASHER_DRYER,
-            STEAM_OVEN_COMBI,
-            STEAM_OVEN_MICRO,
-            DIALOG_OVEN,
-            ROBOT_VACUUM_CLEANER,
-            STEAM_OVEN_MK2,
-        ],
+        types=_ELAPSED_TIME_TYPES,
         description=MieleSensorDescription(
             key="stateElapsedTimeAbs",
             data_tag="state|elapsedTime|0",
@@ -614,11 +590,7 @@ SENSOR_TYPES: Final[tuple[MieleSensorDefinition, ...]] = (
         ),
     ),
     MieleSensorDefinition(
-        types=[
-            WASHING_MACHINE,
-            DISHWASHER,
-            WASHER_DRYER,
-        ],
+        types=_WATER_TYPES,
         description=MieleSensorDescription(
             key="stateCurrentWaterConsumption",
             data_tag="state|ecoFeedback|currentWaterConsumption|value",
@@ -631,13 +603,7 @@ SENSOR_TYPES: Final[tuple[MieleSensorDefinition, ...]] = (
         ),
     ),
     MieleSensorDefinition(
-        types=[
-            WASHING_MACHINE,
-            TUMBLE_DRYER,
-            TUMBLE_DRYER_SEMI_PROFESSIONAL,
-            DISHWASHER,
-            WASHER_DRYER,
-        ],
+        types=_ENERGY_TYPES,
         description=MieleSensorDescription(
             key="stateCurrentEnergyConsumption",
             data_tag="state|ecoFeedback|currentEnergyConsumption|value",
@@ -650,11 +616,7 @@ SENSOR_TYPES: Final[tuple[MieleSensorDefinition, ...]] = (
         ),
     ),
     MieleSensorDefinition(
-        types=[
-            WASHING_MACHINE,
-            DISHWASHER,
-            WASHER_DRYER,
-        ],
+        types=_WATER_TYPES,
         description=MieleSensorDescription(
             key="stateWaterForecast",
             data_tag="state|ecoFeedback|waterForecast",
@@ -663,17 +625,11 @@ SENSOR_TYPES: Final[tuple[MieleSensorDefinition, ...]] = (
             native_unit_of_measurement=PERCENTAGE,
             entity_category=EntityCategory.DIAGNOSTIC,
             entity_registry_enabled_default=False,
-            convert=lambda x, t: x * 100.0,
+            convert=_convert_percentage,
         ),
     ),
     MieleSensorDefinition(
-        types=[
-            WASHING_MACHINE,
-            TUMBLE_DRYER,
-            TUMBLE_DRYER_SEMI_PROFESSIONAL,
-            DISHWASHER,
-            WASHER_DRYER,
-        ],
+        types=_ENERGY_TYPES,
         description=MieleSensorDescription(
             key="stateEnergyForecast",
             data_tag="state|ecoFeedback|energyForecast",
@@ -682,13 +638,15 @@ SENSOR_TYPES: Final[tuple[MieleSensorDefinition, ...]] = (
             native_unit_of_measurement=PERCENTAGE,
             entity_category=EntityCategory.DIAGNOSTIC,
             entity_registry_enabled_default=False,
-            convert=lambda x, t: x * 100.0,
+            convert=_convert_percentage,
         ),
     ),
     MieleSensorDefinition(
-        types=[
-            ROBOT_VACUUM_CLEANER,
-        ],
+        types=frozenset(
+            {
+                ROBOT_VACUUM_CLEANER,
+            }
+        ),
         description=MieleSensorDescription(
             key="batteryLevel",
             data_tag="state|batteryLevel",
@@ -699,7 +657,7 @@ SENSOR_TYPES: Final[tuple[MieleSensorDefinition, ...]] = (
         ),
     ),
     MieleSensorDefinition(
-        types=[OVEN, OVEN_MICROWAVE, STEAM_OVEN_COMBI, STEAM_OVEN_MK2],
+        types=_CORE_TEMPERATURE_TYPES,
         description=MieleSensorDescription(
             key="coreTemperature",
             data_tag="state|coreTemperature|0|value_raw",
@@ -707,11 +665,11 @@ SENSOR_TYPES: Final[tuple[MieleSensorDefinition, ...]] = (
             device_class=SensorDeviceClass.TEMPERATURE,
             native_unit_of_measurement=UnitOfTemperature.CELSIUS,
             state_class=SensorStateClass.MEASUREMENT,
-            convert=lambda x, t: x / 100.0,
+            convert=_convert_centi,
         ),
     ),
     MieleSensorDefinition(
-        types=[OVEN, OVEN_MICROWAVE, STEAM_OVEN_COMBI, STEAM_OVEN_MK2],
+        types=_CORE_TEMPERATURE_TYPES,
         description=MieleSensorDescription(
             key="coreTargetTemperature",
             data_tag="state|coreTargetTemperature|0|value_raw",
@@ -719,85 +677,40 @@ SENSOR_TYPES: Final[tuple[MieleSensorDefinition, ...]] = (
             icon="mdi:thermometer-check",
             device_class=SensorDeviceClass.TEMPERATURE,
             native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-            convert=lambda x, t: x / 100.0,
+            convert=_convert_centi,
             entity_category=EntityCategory.DIAGNOSTIC,
         ),
     ),
-    MieleSensorDefinition(
-        types=[HOB_INDUCTION, HOB_HIGHLIGHT, HOB_INDUCT_EXTR],
-        description=MieleSensorDescription(
-            key="plateStep",
-            data_tag="state|plateStep|0|value_raw",
-            data_tag_loc="state|plateStep|0|value_localized",
-            name="Level Zone 1",
-            icon="mdi:circle-double",
-            entity_category=EntityCategory.DIAGNOSTIC,
-            entity_registry_enabled_default=False,
-        ),
-    ),
-    MieleSensorDefinition(
-        types=[HOB_INDUCTION, HOB_HIGHLIGHT, HOB_INDUCT_EXTR],
-        description=MieleSensorDescription(
-            key="plateStep1",
-            data_tag="state|plateStep|1|value_raw",
-            data_tag_loc="state|plateStep|1|value_localized",
-            name="Level Zone 2",
-            icon="mdi:circle-double",
-            entity_category=EntityCategory.DIAGNOSTIC,
-            entity_registry_enabled_default=False,
-        ),
-    ),
-    MieleSensorDefinition(
-        types=[HOB_INDUCTION, HOB_HIGHLIGHT, HOB_INDUCT_EXTR],
-        description=MieleSensorDescription(
-            key="plateStep2",
-            data_tag="state|plateStep|2|value_raw",
-            data_tag_loc="state|plateStep|2|value_localized",
-            name="Level Zone 3",
-            icon="mdi:circle-double",
-            entity_category=EntityCategory.DIAGNOSTIC,
-            entity_registry_enabled_default=False,
-        ),
-    ),
-    MieleSensorDefinition(
-        types=[HOB_INDUCTION, HOB_HIGHLIGHT, HOB_INDUCT_EXTR],
-        description=MieleSensorDescription(
-            key="plateStep3",
-            data_tag="state|plateStep|3|value_raw",
-            data_tag_loc="state|plateStep|3|value_localized",
-            name="Level Zone 4",
-            icon="mdi:circle-double",
-            entity_category=EntityCategory.DIAGNOSTIC,
-            entity_registry_enabled_default=False,
-        ),
-    ),
-    MieleSensorDefinition(
-        types=[HOB_INDUCTION, HOB_HIGHLIGHT, HOB_INDUCT_EXTR],
-        description=MieleSensorDescription(
-            key="plateStep4",
-            data_tag="state|plateStep|4|value_raw",
-            data_tag_loc="state|plateStep|4|value_localized",
-            name="Level Zone 5",
-            icon="mdi:circle-double",
-            entity_category=EntityCategory.DIAGNOSTIC,
-            entity_registry_enabled_default=False,
-        ),
-    ),
-    MieleSensorDefinition(
-        types=[HOB_INDUCTION, HOB_HIGHLIGHT, HOB_INDUCT_EXTR],
-        description=MieleSensorDescription(
-            key="plateStep5",
-            data_tag="state|plateStep|5|value_raw",
-            data_tag_loc="state|plateStep|5|value_localized",
-            name="Level Zone 6",
-            icon="mdi:circle-double",
-            entity_category=EntityCategory.DIAGNOSTIC,
-            entity_registry_enabled_default=False,
-        ),
+    *(
+        MieleSensorDefinition(
+            types=_HOB_TYPES,
+            description=MieleSensorDescription(
+                key=f"plateStep{zone or ''}",
+                data_tag=f"state|plateStep|{zone}|value_raw",
+                data_tag_loc=f"state|plateStep|{zone}|value_localized",
+                name=f"Level Zone {zone + 1}",
+                icon="mdi:circle-double",
+                entity_category=EntityCategory.DIAGNOSTIC,
+                entity_registry_enabled_default=False,
+            ),
+        )
+        for zone in range(6)
     ),
 )
 
 
+def _build_defs_by_type() -> dict[int, list[MieleSensorDescription]]:
+    """Index the sensor descriptions by appliance type."""
+    defs_by_type: dict[int, list[MieleSensorDescription]] = {}
+    for definition in SENSOR_TYPES:
+        for appliance_type in definition.types:
+            defs_by_type.setdefault(appliance_type, []).append(definition.description)
+    return defs_by_type
+
+
+_DEFS_BY_TYPE: Final = _build_defs_by_type()
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigType,
@@ -806,13 +719,47 @@ async def async_setup_entry(
     """Set up the sensor platform."""
     coordinator = await get_coordinator(hass, config_entry)
 
+    # Take the time once per coordinator update and share it between the
+    # time sensors. Registered ahead of the entities so it runs first.
+    update_time = _UpdateTime()
+
+    @callback
+    def _async_update_time() -> None:
+        update_time.now = dt_util.now().replace(second=0, microsecond=0)
+
+    _async_update_time()
+    config_entry.async_on_unload(coordinator.async_add_listener(_async_update_time))
+
     entities = []
-    for idx, ent in enumerate(coordinator.data):
-        for definition in SENSOR_TYPES:
-            if coordinator.data[ent]["ident|type|value_raw"] in definition.types:
-                entities.append(
-                    MieleSensor(coordinator, idx, ent, definition.description)
-                )
+    for ent, data in coordinator.data.items():
+        appliance_type = data["ident|type|value_raw"]
+        descriptions = _DEFS_BY_TYPE.get(appliance_type)
+        if not descriptions:
+            continue
+        # All sensors of an appliance share the same device info
+        appl_type = data["ident|type|value_localized"]
+        if appl_type == "":
+            appl_type = data["ident|deviceIdentLabel|techType"]
+        device_info = DeviceInfo(
+            identifiers={(DOMAIN, ent)},
+            serial_number=ent,
+            name=appl_type,
+            manufacturer=MANUFACTURER,
+            model=data["ident|deviceIdentLabel|techType"],
+            hw_version=data["ident|xkmIdentLabel|techType"],
+            sw_version=data["ident|xkmIdentLabel|releaseVersion"],
+        )
+        entities.extend(
+            MieleSensor(
+                coordinator,
+                ent,
+                description,
+                appliance_type,
+                device_info,
+                update_time=update_time,
+            )
+            for description in descriptions
+        )
 
     async_add_entities(entities)
 
@@ -825,302 +772,262 @@ class MieleSensor(CoordinatorEntity, SensorEntity):
     def __init__(
         self,
         coordinator: DataUpdateCoordinator,
-        idx,
         ent,
         description: MieleSensorDescription,
+        appliance_type: int,
+        device_info: DeviceInfo,
+        *,
+        update_time: _UpdateTime,
     ):
         """Initialize the sensor."""
         super().__init__(coordinator)
-        self._idx = idx
+        self._update_time = update_time
         self._ent = ent
+        self._appliance_type = appliance_type
         self.entity_description = description
-        _LOGGER.debug("init sensor %s", ent)
-        appl_type = self.coordinator.data[self._ent][self.entity_description.type_key]
-        if appl_type == "":
-            appl_type = self.coordinator.data[self._ent][
-                "ident|deviceIdentLabel|techType"
-            ]
+        self._data = coordinator.data[ent]
+        self._key = description.key
+        # The status sensor reports the connection state itself
+        self._always_available = description.key == "stateStatus"
+        self._type_key = description.type_key
+        self._tag = description.data_tag
+        # Hours and minutes of the time sensors, each pair read in one call
+        self._get_time = None
+        self._get_time2 = None
+        if description.data_tag1 is not None:
+            self._get_time = itemgetter(description.data_tag, description.data_tag1)
+            if description.data_tag2 is not None and description.data_tag3 is not None:
+                self._get_time2 = itemgetter(
+                    description.data_tag2, description.data_tag3
+                )
+        self._tag_loc = description.data_tag_loc
+        self._tag_localized = (
+            description.data_tag.replace("_raw", "_localized")
+            if description.data_tag is not None
+            else None
+        )
+        self._status_key = description.status_key_raw
+        self._convert = None
+        if description.convert is not None:
+            # The appliance type is fixed for a device, so bind it once
+            convert = description.convert
+            appliance_type = self._appliance_type
+            self._convert = lambda value: convert(value, appliance_type)
+        self._native_value_impl = _NATIVE_VALUE_HANDLERS.get(
+            description.key, MieleSensor._native_value_default
+        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("init sensor %s", ent)
         self._attr_has_entity_name = True
         self._attr_unique_id = f"{self.entity_description.key}-{self._ent}"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, self._ent)},
-            serial_number=self._ent,
-            name=appl_type,
-            manufacturer=MANUFACTURER,
-            model=self.coordinator.data[self._ent]["ident|deviceIdentLabel|techType"],
-            hw_version=self.coordinator.data[self._ent]["ident|xkmIdentLabel|techType"],
-            sw_version=self.coordinator.data[self._ent][
-                "ident|xkmIdentLabel|releaseVersion"
-            ],
-        )
+        self._attr_device_info = device_info
         if self.entity_description.convert_icon is not None:
-            self._attr_icon = self.entity_description.convert_icon(
-                self.coordinator.data[self._ent][self.entity_description.type_key_raw],
-            )
-        self._available_states = []
-        if self.entity_description.available_states is not None:
-            self._available_states = self.entity_description.available_states(
-                self.coordinator.data[self._ent][self.entity_description.type_key_raw],
-            )
+            self._attr_icon = self.entity_description.convert_icon(self._appliance_type)
         self._last_elapsed_time_reported = None
         self._last_started_time_reported = None
         self._last_abs_time = {}
+        self._program_ids = {}
+        # Only the raw and localized values change after setup, so the
+        # identification attributes are filled in once here
+        self._extra_attributes = None
+        self._has_raw_value = False
+        if description.extra_attributes is not None:
+            data = self._data
+            attr = dict(description.extra_attributes)
+            self._has_raw_value = "Raw value" in attr
+            if self._has_raw_value:
+                attr["Localized"] = None
+            if "serial_no" in attr:
+                attr["serial_no"] = ent
+            if "appliance" in attr:
+                attr["appliance"] = data[self._type_key]
+            if "manufacturer" in attr:
+                attr["manufacturer"] = MANUFACTURER
+            if "model" in attr:
+                attr["model"] = data["ident|deviceIdentLabel|techType"]
+            if "HW version" in attr:
+                attr["HW version"] = data["ident|xkmIdentLabel|techType"]
+            if "SW version" in attr:
+                attr["SW version"] = data["ident|xkmIdentLabel|releaseVersion"]
+            self._extra_attributes = attr
+
+    async def async_added_to_hass(self) -> None:
+        """Run when entity is about to be added to hass."""
+        await super().async_added_to_hass()
+        # The coordinator may have refreshed since the entity was created
+        self._data = self.coordinator.data[self._ent]
+        # The mapping comes from configuration.yaml and is keyed by entity_id,
+        # which is only known once the entity is added
+        self._program_ids = (
+            self.hass.data[DOMAIN]
+            .get(CONF_SENSORS, {})
+            .get(self.entity_id, {})
+            .get(CONF_PROGRAM_IDS, {})
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._data = self.coordinator.data[self._ent]
+        super()._handle_coordinator_update()
+
+    @cached_property
+    def _available_states(self):
+        """Return the states available for the appliance type."""
+        if self.entity_description.available_states is None:
+            return []
+        return self.entity_description.available_states(self._appliance_type)
 
     @property
     def native_value(self):
         """Return the state of the sensor."""
-        if self.entity_description.key in [
-            "stateRemainingTime",
-            "stateStartTime",
-        ]:
-            return self._get_minutes()
-
-        if self.entity_description.key in [
-            "stateElapsedTime",
-        ]:
-            mins = self._get_minutes()
-            # Keep value when program ends
-            if (
-                self.coordinator.data[self._ent][self.entity_description.status_key_raw]
-                == STATE_STATUS_PROGRAM_ENDED
-            ):
-                return self._last_elapsed_time_reported
-            # Force 0 when appliance is off
-            if (
-                self.coordinator.data[self._ent][self.entity_description.status_key_raw]
-                == STATE_STATUS_OFF
-            ):
-                return 0
-            self._last_elapsed_time_reported = mins
-            return mins
+        return self._native_value_impl(self)
 
-        if self.entity_description.key in [
-            "stateRemainingTimeAbs",
-            "stateStartTimeAbs",
-        ]:
-            return self._get_absolute_time()
+    def _native_value_elapsed(self):
+        status = self._data[self._status_key]
+        # Keep value when program ends
+        if status == STATE_STATUS_PROGRAM_ENDED:
+            return self._last_elapsed_time_reported
+        # Force 0 when appliance is off
+        if status == STATE_STATUS_OFF:
+            return 0
+        mins = self._get_minutes()
+        self._last_elapsed_time_reported = mins
+        return mins
 
-        if self.entity_description.key in [
-            "stateElapsedTimeAbs",
-        ]:
-            started_time = self._get_absolute_time(sub=True)
-            # Don't update sensor if state == program_ended
-            if (
-                self.coordinator.data[self._ent][self.entity_description.status_key_raw]
-                == STATE_STATUS_PROGRAM_ENDED
-            ):
-                return self._last_started_time_reported
-            # Force no state when appliance is off
-            if (
-                self.coordinator.data[self._ent][self.entity_description.status_key_raw]
-                == STATE_STATUS_OFF
-            ):
-                return None
-            self._last_started_time_reported = started_time
-            return started_time
+    def _native_value_elapsed_absolute(self):
+        started_time = self._get_absolute_time(sub=True)
+        status = self._data[self._status_key]
+        # Don't update sensor if state == program_ended
+        if status == STATE_STATUS_PROGRAM_ENDED:
+            return self._last_started_time_reported
+        # Force no state when appliance is off
+        if status == STATE_STATUS_OFF:
+            return None
+        self._last_started_time_reported = started_time
+        return started_time
 
-        if self.entity_description.key in [
-            "plateStep",
-            "plateStep1",
-            "plateStep2",
-            "plateStep3",
-            "plateStep4",
-            "plateStep5",
-        ]:
-            if (
-                self.coordinator.data[self._ent].get(self.entity_description.data_tag)
-                is None
-            ):
-                return 0
-            else:
-                return self.coordinator.data[self._ent][
-                    self.entity_description.data_tag_loc
-                ]
+    def _native_value_plate_step(self):
+        data = self._data
+        return 0 if data.get(self._tag) is None else data[self._tag_loc]
 
+    def _native_value_program(self):
         # Log raw and localized values for programID etc
         # Active if logger.level is DEBUG or INFO
-        if _LOGGER.getEffectiveLevel() <= logging.INFO:
-            if self.entity_description.key in {
-                "stateProgramPhase",
-                "stateProgramId",
-                "stateProgramType",
-            }:
-                while len(self.hass.data[DOMAIN]["id_log"]) >= 500:
-                    self.hass.data[DOMAIN]["id_log"].pop()
-
-                self.hass.data[DOMAIN]["id_log"].append(
-                    {
-                        "appliance": self.coordinator.data[self._ent][
-                            self.entity_description.type_key
-                        ],
-                        "key": self.entity_description.key,
-                        "raw": self.coordinator.data[self._ent][
-                            self.entity_description.data_tag
-                        ],
-                        "localized": self.coordinator.data[self._ent][
-                            self.entity_description.data_tag_loc
-                        ],
-                    }
-                )
+        if _LOGGER.isEnabledFor(logging.INFO):
+            data = self._data
+            self.hass.data[DOMAIN]["id_log"].append(
+                {
+                    "appliance": data[self._type_key],
+                    "key": self._key,
+                    "raw": data[self._tag],
+                    "localized": data[self._tag_loc],
+                }
+            )
+        return self._native_value_default()
 
+    def _native_value_consumption(self):
         # Show 0 consumption when the appliance is not running,
         # to correctly reset utility meter cycle. Ignore this when
         # appliance is not connected (it may disconnect while a program
         # is running causing problems in energy stats).
-        state = self.coordinator.data[self._ent][self.entity_description.status_key_raw]
-        if self.entity_description.key in [
-            "stateCurrentEnergyConsumption",
-            "stateCurrentWaterConsumption",
-        ] and state in [
-            STATE_STATUS_ON,
-            STATE_STATUS_OFF,
-            STATE_STATUS_PROGRAMMED,
-            STATE_STATUS_WAITING_TO_START,
-            STATE_STATUS_IDLE,
-            STATE_STATUS_SERVICE,
-        ]:
+        if self._data[self._status_key] in _NOT_RUNNING_STATES:
             return 0
+        return self._native_value_default()
 
-        if (
-            self.coordinator.data[self._ent].get(self.entity_description.data_tag)
-            is None
-        ):
-            return None
-        if self.coordinator.data[self._ent].get(
-            self.entity_description.data_tag, -32768
-        ) in (
-            -32766,
-            -32768,
-        ):
+    def _native_value_default(self):
+        data = self._data
+        raw = data.get(self._tag)
+        if raw is None or raw in SENSOR_SENTINEL_VALUES:
             return None
-        if (
-            self.entity_description.key in ["stateProgramId", "stateProgramPhase"]
-            and self.coordinator.data[self._ent][self.entity_description.data_tag] <= 0
-        ):
+        if self._key in _PROGRAM_ID_PHASE_KEYS and raw <= 0:
             return None
 
-        if self.entity_description.convert is None:
-            return self.coordinator.data[self._ent][self.entity_description.data_tag]
+        if self._convert is None:
+            return raw
 
         # If configuration.yaml contains an overridden mapping, use that value if available
-        custom_mapped_value = self._get_custom_mapped_value(
-            self.coordinator.data[self._ent][self.entity_description.data_tag]
-        )
-        if (
-            custom_mapped_value is not None
-            and custom_mapped_value in self._available_states
-        ):
-            return custom_mapped_value
+        if self._program_ids:
+            custom_mapped_value = self._program_ids.get(raw)
+            if (
+                custom_mapped_value is not None
+                and custom_mapped_value in self._available_states
+            ):
+                return custom_mapped_value
 
         # Otherwise use converter specified in entity description
-        return self.entity_description.convert(
-            self.coordinator.data[self._ent][self.entity_description.data_tag],
-            self.coordinator.data[self._ent][self.entity_description.type_key_raw],
-        )
+        return self._convert(raw)
 
     def _get_minutes(self):
-        mins = (
-            self.coordinator.data[self._ent][self.entity_description.data_tag] * 60
-            + self.coordinator.data[self._ent][self.entity_description.data_tag1]
-        )
-        if (
-            self.entity_description.data_tag2 is not None
-            and self.entity_description.data_tag2 is not None
-        ):
-            mins = mins + (
-                self.coordinator.data[self._ent][self.entity_description.data_tag2] * 60
-                + self.coordinator.data[self._ent][self.entity_description.data_tag3]
-            )
+        data = self._data
+        hours, minutes = self._get_time(data)
+        mins = hours * 60 + minutes
+        if self._get_time2 is not None:
+            hours, minutes = self._get_time2(data)
+            mins += hours * 60 + minutes
         return mins
 
     def _get_absolute_time(self, sub=False):
-        now = dt_util.now().replace(second=0, microsecond=0)
+        now = self._update_time.now
         mins = self._get_minutes()
         if mins == 0:
             return None
-        if sub:
-            val = now - timedelta(minutes=mins)
-        else:
-            val = now + timedelta(minutes=mins)
-        formatted = val.strftime("%H:%M")
-        _LOGGER.debug(
-            "Key:  %s | Dev: %s | Mins: %s | Now: %s | State: %s",
-            self.entity_description.key,
-            self._ent,
-            mins,
-            now,
-            formatted,
-        )
+        val = now + timedelta(minutes=-mins if sub else mins)
+        formatted = f"{val.hour:02d}:{val.minute:02d}"
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Key:  %s | Dev: %s | Mins: %s | Now: %s | State: %s",
+                self._key,
+                self._ent,
+                mins,
+                now,
+                formatted,
+            )
         # check for previous value and return it if differning of +/-1 min
-        if self.entity_description.key in self._last_abs_time:
-            previous_value = self._last_abs_time[self.entity_description.key]
+        if self._key in self._last_abs_time:
+            previous_value = self._last_abs_time[self._key]
             prev_minute = previous_value - timedelta(seconds=120)
             next_minute = previous_value + timedelta(seconds=120)
             if prev_minute <= val <= next_minute:
-                return previous_value.strftime("%H:%M")
-        self._last_abs_time[self.entity_description.key] = val
+                return f"{previous_value.hour:02d}:{previous_value.minute:02d}"
+        self._last_abs_time[self._key] = val
         return formatted
 
     @property
     def available(self):
         """Return the availability of the entity."""
 
-        if self.entity_description.key == "stateStatus":
+        if self._always_available:
             return True
 
         if not self.coordinator.last_update_success:
             return False
 
-        return (
-            self.coordinator.data[self._ent][self.entity_description.status_key_raw]
-            != STATE_STATUS_NOT_CONNECTED
-        )
+        return self._data[self._status_key] != STATE_STATUS_NOT_CONNECTED
 
     @property
     def extra_state_attributes(self):
         """Return extra_state_attributes."""
-        if self.entity_description.extra_attributes is None:
-            return None
-        attr = self.entity_description.extra_attributes
-        if "Raw value" in self.entity_description.extra_attributes:
-            attr["Raw value"] = self.coordinator.data[self._ent][
-                self.entity_description.data_tag
-            ]
-            attr["Localized"] = self.coordinator.data[self._ent][
-                self.entity_description.data_tag.replace("_raw", "_localized")
-            ]
-        if "serial_no" in self.entity_description.extra_attributes:
-            attr["serial_no"] = self._ent
-
-        if "appliance" in self.entity_description.extra_attributes:
-            attr["appliance"] = self.coordinator.data[self._ent][
-                self.entity_description.type_key
-            ]
-
-        if "manufacturer" in self.entity_description.extra_attributes:
-            attr["manufacturer"] = MANUFACTURER
-
-        if "model" in self.entity_description.extra_attributes:
-            attr["model"] = self.coordinator.data[self._ent][
-                "ident|deviceIdentLabel|techType"
-            ]
-
-        if "HW version" in self.entity_description.extra_attributes:
-            attr["HW version"] = self.coordinator.data[self._ent][
-                "ident|xkmIdentLabel|techType"
-            ]
-
-        if "SW version" in self.entity_description.extra_attributes:
-            attr["SW version"] = self.coordinator.data[self._ent][
-                "ident|xkmIdentLabel|releaseVersion"
-            ]
-
+        attr = self._extra_attributes
+        if self._has_raw_value:
+            data = self._data
+            attr["Raw value"] = data[self._tag]
+            attr["Localized"] = data[self._tag_localized]
         return attr
 
-    def _get_sensor_config(self):
-        """Return sensor config for current entity."""
-        return self.hass.data[DOMAIN].get(CONF_SENSORS, {}).get(self.entity_id, {})
 
-    def _get_custom_mapped_value(self, raw_value):
-        """Return sensor value mapping for current entity."""
-        return self._get_sensor_config().get(CONF_PROGRAM_IDS, {}).get(raw_value, None)
+# Specialized native_value implementations, resolved once per entity
+_NATIVE_VALUE_HANDLERS: Final[dict[str, Callable[[MieleSensor], Any]]] = {
+    "stateRemainingTime": MieleSensor._get_minutes,
+    "stateStartTime": MieleSensor._get_minutes,
+    "stateElapsedTime": MieleSensor._native_value_elapsed,
+    "stateRemainingTimeAbs": MieleSensor._get_absolute_time,
+    "stateStartTimeAbs": MieleSensor._get_absolute_time,
+    "stateElapsedTimeAbs": MieleSensor._native_value_elapsed_absolute,
+    **dict.fromkeys(_CONSUMPTION_KEYS, MieleSensor._native_value_consumption),
+    **dict.fromkeys(_PROGRAM_LOG_KEYS, MieleSensor._native_value_program),
+    **{
+        f"plateStep{zone or ''}": MieleSensor._native_value_plate_step
+        for zone in range(6)
+    },
+}
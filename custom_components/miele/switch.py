@@ -76,7 +76,7 @@ class MieleSwitchDefinition:
 
 SWITCH_TYPES: Final[tuple[MieleSwitchDefinition, ...]] = (
     MieleSwitchDefinition(
-        types=[FRIDGE, FRIDGE_FREEZER],
+        types=(FRIDGE, FRIDGE_FREEZER),
         description=MieleSwitchDescription(
             key="supercooling",
             data_tag="state|status|value_raw",
@@ -88,7 +88,7 @@ SWITCH_TYPES: Final[tuple[MieleSwitchDefinition, ...]] = (
         ),
     ),
     MieleSwitchDefinition(
-        types=[FREEZER, FRIDGE_FREEZER, WINE_CABINET_FREEZER],
+        types=(FREEZER, FRIDGE_FREEZER, WINE_CABINET_FREEZER),
         description=MieleSwitchDescription(
             key="superfreezing",
             data_tag="state|status|value_raw",
@@ -100,7 +100,7 @@ SWITCH_TYPES: Final[tuple[MieleSwitchDefinition, ...]] = (
         ),
     ),
     MieleSwitchDefinition(
-        types=[
+        types=(
             WASHING_MACHINE,
             TUMBLE_DRYER,
             TUMBLE_DRYER_SEMI_PROFESSIONAL,
@@ -116,7 +116,7 @@ SWITCH_TYPES: Final[tuple[MieleSwitchDefinition, ...]] = (
             STEAM_OVEN_MICRO,
             DIALOG_OVEN,
             STEAM_OVEN_MK2,
-        ],
+        ),
         description=MieleSwitchDescription(
             key="poweronoff",
             data_tag="state|status|value_raw",
@@ -139,9 +139,10 @@ async def async_setup_entry(
     coordinator = await get_coordinator(hass, config_entry)
 
     entities = []
-    for idx, ent in enumerate(coordinator.data):
+    for idx, (ent, data) in enumerate(coordinator.data.items()):
+        appliance_type = data["ident|type|value_raw"]
         for definition in SWITCH_TYPES:
-            if coordinator.data[ent]["ident|type|value_raw"] in definition.types:
+            if appliance_type in definition.types:
                 entities.append(
                     MieleSwitch(
                         coordinator,
@@ -179,11 +180,11 @@ class MieleSwitch(CoordinatorEntity, SwitchEntity):
         self._ent = ent
         self.entity_description = description
         _LOGGER.debug("init switch %s", ent)
-        appl_type = self.coordinator.data[self._ent][self.entity_description.type_key]
+        device = self.coordinator.data[self._ent]
+        tech_type = device["ident|deviceIdentLabel|techType"]
+        appl_type = device[self.entity_description.type_key]
         if appl_type == "":
-            appl_type = self.coordinator.data[self._ent][
-                "ident|deviceIdentLabel|techType"
-            ]
+            appl_type = tech_type
         self._attr_has_entity_name = True
         self._attr_unique_id = f"{self.entity_description.key}-{self._ent}"
         self._attr_device_info = DeviceInfo(
@@ -191,7 +192,7 @@ class MieleSwitch(CoordinatorEntity, SwitchEntity):
             serial_number=self._ent,
             name=appl_type,
             manufacturer=MANUFACTURER,
-            model=self.coordinator.data[self._ent]["ident|deviceIdentLabel|techType"],
+            model=tech_type,
         )
 
     @property
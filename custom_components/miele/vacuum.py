@@ -88,7 +88,7 @@ class MieleVacuumDefinition:
 
 VACUUM_TYPES: Final[tuple[MieleVacuumDefinition, ...]] = (
     MieleVacuumDefinition(
-        types=[ROBOT_VACUUM_CLEANER],
+        types=(ROBOT_VACUUM_CLEANER,),
         description=MieleVacuumDescription(
             key="vacuum",
             data_tag="state|status|value_raw",
@@ -108,9 +108,10 @@ async def async_setup_entry(
     coordinator = await get_coordinator(hass, config_entry)
 
     entities = []
-    for idx, ent in enumerate(coordinator.data):
+    for idx, (ent, data) in enumerate(coordinator.data.items()):
+        appliance_type = data["ident|type|value_raw"]
         for definition in VACUUM_TYPES:
-            if coordinator.data[ent]["ident|type|value_raw"] in definition.types:
+            if appliance_type in definition.types:
                 entities.append(
                     MieleVacuum(
                         coordinator,
@@ -149,11 +150,11 @@ class MieleVacuum(CoordinatorEntity, StateVacuumEntity):
         self._phase = None
         self.entity_description = description
         _LOGGER.debug("init vacuum %s", ent)
-        appl_type = self.coordinator.data[self._ent][self.entity_description.type_key]
+        device = self.coordinator.data[self._ent]
+        tech_type = device["ident|deviceIdentLabel|techType"]
+        appl_type = device[self.entity_description.type_key]
         if appl_type == "":
-            appl_type = self.coordinator.data[self._ent][
-                "ident|deviceIdentLabel|techType"
-            ]
+            appl_type = tech_type
         self._attr_supported_features = SUPPORTED_FEATURES
         self._attr_fan_speed_list = FAN_SPEEDS
         self._attr_has_entity_name = True
@@ -163,7 +164,7 @@ class MieleVacuum(CoordinatorEntity, StateVacuumEntity):
             serial_number=self._ent,
             name=appl_type,
             manufacturer=MANUFACTURER,
-            model=self.coordinator.data[self._ent]["ident|deviceIdentLabel|techType"],
+            model=tech_type,
         )
 
     @property